@@ -6,7 +6,15 @@ Verifies that all required dependencies are correctly installed.
 Run this script to diagnose installation issues.
 """
 
+import argparse
+import asyncio
+import concurrent.futures
+import contextvars
 import importlib.metadata
+import importlib.util
+import io
+import json
+import math
 import os
 from pathlib import Path
 import shutil
@@ -15,8 +23,6 @@ import sys
 
 # Set Windows console UTF-8 encoding
 if sys.platform == "win32":
-    import io
-
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
 
@@ -41,31 +47,54 @@ if not sys.stdout.isatty():
     Colors.disable()
 
 
+# Output buffer for the current context (None = stdout). main() collects the
+# whole report in one buffer and writes it out at once; checks run
+# concurrently, so each one writes to its own buffer and the buffers are
+# appended in a fixed order to keep sections from interleaving.
+_output: contextvars.ContextVar[io.StringIO | None] = contextvars.ContextVar(
+    "_output", default=None
+)
+
+
+def _emit(text: str = "", end: str = "\n"):
+    """Write text to the current output buffer, or stdout"""
+    buffer = _output.get()
+    print(text, end=end, file=sys.stdout if buffer is None else buffer)
+
+
+# Message prefixes, built once now that color support is decided
+_RULE = "=" * 60
+_SUCCESS_PREFIX = f"{Colors.GREEN}✅ "
+_ERROR_PREFIX = f"{Colors.RED}❌ "
+_WARNING_PREFIX = f"{Colors.YELLOW}⚠️  "
+_INFO_PREFIX = f"{Colors.CYAN}ℹ️  "
+
+
 def print_header(message: str):
     """Print section header"""
-    print(f"\n{'=' * 60}")
-    print(f"📋 {message}")
-    print("=" * 60)
+    _emit("\n" + _RULE)
+    _emit("📋 " + message)
+    _emit(_RULE)
 
 
 def print_success(message: str):
     """Print success message"""
-    print(f"{Colors.GREEN}✅ {message}{Colors.NC}")
+    _emit(_SUCCESS_PREFIX + message + Colors.NC)
 
 
 def print_error(message: str):
     """Print error message"""
-    print(f"{Colors.RED}❌ {message}{Colors.NC}")
+    _emit(_ERROR_PREFIX + message + Colors.NC)
 
 
 def print_warning(message: str):
     """Print warning message"""
-    print(f"{Colors.YELLOW}⚠️  {message}{Colors.NC}")
+    _emit(_WARNING_PREFIX + message + Colors.NC)
 
 
 def print_info(message: str):
     """Print info message"""
-    print(f"{Colors.CYAN}ℹ️  {message}{Colors.NC}")
+    _emit(_INFO_PREFIX + message + Colors.NC)
 
 
 def get_package_version(package_name: str) -> str | None:
@@ -76,6 +105,74 @@ def get_package_version(package_name: str) -> str | None:
         return None
 
 
+def is_installed(import_name: str) -> bool:
+    """Check that a package can be found, without executing its code"""
+    # find_spec only consults the import finders; actually importing packages
+    # such as lightrag or raganything would run their multi-second initialization
+    try:
+        spec = importlib.util.find_spec(import_name)
+    except (ImportError, ValueError):
+        return False
+    # A bare directory on sys.path is found as a namespace package, which has
+    # no origin; only count modules and regular packages
+    return spec is not None and spec.origin is not None
+
+
+def list_dir(path: Path) -> dict[str, bool]:
+    """List a directory with one scandir, mapping entry names to is_dir (empty if missing)"""
+    try:
+        with os.scandir(path) as entries:
+            # is_dir() follows symlinks, so broken links are not counted as directories
+            return {entry.name: entry.is_dir() for entry in entries}
+    except OSError:
+        return {}
+
+
+def probe_package(
+    pip_name: str, import_name: str, with_version: bool = True
+) -> tuple[bool, str | None]:
+    """Probe a backend package, returning (installed, installed version)"""
+    if not is_installed(import_name):
+        return False, None
+    return True, get_package_version(pip_name) if with_version else None
+
+
+def probe_tool(command: str, timeout: float | None = None) -> tuple[bool, str | None, str | None]:
+    """Locate a command-line tool; with a timeout, also run `<tool> --version`
+
+    Returns (found, version, error); version is None if the tool was not run,
+    error describes why the version check failed.
+    """
+    if not shutil.which(command):
+        return False, None, None
+    if timeout is None:
+        return True, None, None
+    try:
+        result = subprocess.run(
+            [command, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return True, None, f"exceeded {timeout:g}s, skipping"
+    except Exception as e:
+        return True, None, str(e)
+    return True, result.stdout.strip(), None
+
+
+def probe_tools(
+    *commands: str, timeout: float | None = None
+) -> list[tuple[bool, str | None, str | None]]:
+    """Probe several tools, returning results in argument order"""
+    if timeout is None:
+        # Only PATH lookups, nothing worth running in parallel
+        return [probe_tool(command) for command in commands]
+    # Each probe spawns a subprocess; run them side by side
+    with concurrent.futures.ThreadPoolExecutor() as executor:
+        return list(executor.map(probe_tool, commands, [timeout] * len(commands)))
+
+
 def check_python_environment() -> bool:
     """Check Python environment"""
     print_header("Python Environment")
@@ -111,8 +208,8 @@ def check_python_environment() -> bool:
     return all_ok
 
 
-def check_backend_packages() -> tuple[bool, int, int]:
-    """Check backend Python packages"""
+def check_backend_packages(verbose: bool = False) -> tuple[bool, int, int]:
+    """Check backend Python packages (with versions if verbose)"""
     print_header("Backend Dependencies")
 
     # Required packages: (pip_name, import_name, min_version, is_optional)
@@ -139,7 +236,8 @@ def check_backend_packages() -> tuple[bool, int, int]:
         # RAG
         ("lightrag-hku", "lightrag", "1.0.0", False),
         ("raganything", "raganything", "0.1.0", False),
-        ("llama-index", "llama_index", "0.14.0", False),
+        # llama_index itself is a namespace package; probe its core package
+        ("llama-index", "llama_index.core", "0.14.0", False),
         # Document parsing
         ("docling", "docling", "2.31.0", True),  # Optional
         ("PyMuPDF", "fitz", "1.26.0", False),
@@ -155,25 +253,28 @@ def check_backend_packages() -> tuple[bool, int, int]:
     all_ok = True
 
     for pip_name, import_name, min_version, is_optional in packages:
-        try:
-            __import__(import_name)
-            version = get_package_version(pip_name)
+        found, version = probe_package(pip_name, import_name, verbose)
+        if found:
             version_str = f" (v{version})" if version else ""
             print_success(f"  ✓ {pip_name}{version_str}")
             installed += 1
-        except ImportError:
-            if is_optional:
-                print_warning(f"  ⚠ {pip_name} not installed (optional)")
-            else:
-                print_error(f"  ✗ {pip_name} not installed")
-                all_ok = False
-                missing += 1
+        elif is_optional:
+            print_warning(f"  ⚠ {pip_name} not installed (optional)")
+        else:
+            print_error(f"  ✗ {pip_name} not installed")
+            all_ok = False
+            missing += 1
 
     return all_ok, installed, missing
 
 
-def check_frontend_packages(project_root: Path) -> tuple[bool, int, int]:
-    """Check frontend Node.js packages"""
+def check_frontend_packages(
+    project_root: Path, verbose: bool = False, tool_timeout: float | None = None
+) -> tuple[bool, int, int]:
+    """Check frontend Node.js packages (with versions if verbose)
+
+    npm and node are only executed when tool_timeout is given.
+    """
     print_header("Frontend Dependencies")
 
     web_dir = project_root / "web"
@@ -184,49 +285,42 @@ def check_frontend_packages(project_root: Path) -> tuple[bool, int, int]:
     missing = 0
     all_ok = True
 
+    (npm_found, npm_version, npm_error), (node_found, node_version, node_error) = probe_tools(
+        "npm", "node", timeout=tool_timeout
+    )
+
     # Check npm
-    npm_path = shutil.which("npm")
-    if npm_path:
-        try:
-            result = subprocess.run(
-                ["npm", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            npm_version = result.stdout.strip()
-            print_success(f"npm available (v{npm_version})")
-        except Exception:
-            print_warning("npm found but version check failed")
-    else:
+    if not npm_found:
         print_error("npm not found - Node.js is required for frontend")
         all_ok = False
+    elif npm_error:
+        print_warning(f"npm found but version check failed ({npm_error})")
+    elif npm_version is None:
+        print_success("npm available")
+    else:
+        print_success(f"npm available (v{npm_version})")
 
     # Check node
-    node_path = shutil.which("node")
-    if node_path:
-        try:
-            result = subprocess.run(
-                ["node", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            node_version = result.stdout.strip()
-            print_success(f"Node.js available ({node_version})")
-        except Exception:
-            print_warning("Node.js found but version check failed")
-    else:
+    if not node_found:
         print_error("Node.js not found")
         all_ok = False
+    elif node_error:
+        print_warning(f"Node.js found but version check failed ({node_error})")
+    elif node_version is None:
+        print_success("Node.js available")
+    else:
+        print_success(f"Node.js available ({node_version})")
+
+    # One directory listing instead of a stat per expected file
+    web_entries = list_dir(web_dir)
 
     # Check package.json exists
-    if not package_json.exists():
+    if "package.json" not in web_entries:
         print_error(f"package.json not found: {package_json}")
         return False, 0, 0
 
     # Check node_modules
-    if not node_modules.exists():
+    if not web_entries.get("node_modules"):
         print_error("node_modules directory does not exist")
         print_info("Run 'npm install' in web/ directory to install dependencies")
         return False, 0, 0
@@ -244,17 +338,20 @@ def check_frontend_packages(project_root: Path) -> tuple[bool, int, int]:
 
     print_info("Checking key frontend packages...")
 
+    # Listings of node_modules and of each npm scope (e.g. "@radix-ui"), keyed by scope
+    scope_entries = {"": list_dir(node_modules)}
+
     for pkg in key_packages:
-        pkg_dir = node_modules / pkg
-        if pkg_dir.exists():
+        scope, _, name = pkg.rpartition("/")
+        if scope not in scope_entries:
+            scope_entries[scope] = list_dir(node_modules / scope)
+
+        if scope_entries[scope].get(name):
             # Try to get version from package.json
-            pkg_json = pkg_dir / "package.json"
             version = ""
-            if pkg_json.exists():
+            if verbose:
                 try:
-                    import json
-
-                    with open(pkg_json) as f:
+                    with open(node_modules / pkg / "package.json") as f:
                         data = json.load(f)
                         version = f" (v{data.get('version', '?')})"
                 except Exception:
@@ -269,45 +366,35 @@ def check_frontend_packages(project_root: Path) -> tuple[bool, int, int]:
     return all_ok, installed, missing
 
 
-def check_system_tools() -> bool:
-    """Check system tools and utilities"""
+def check_system_tools(tool_timeout: float | None = None) -> bool:
+    """Check system tools and utilities (executed only when tool_timeout is given)"""
     print_header("System Tools")
 
     all_ok = True
 
+    (git_found, git_version, git_error), (uv_found, uv_version, uv_error) = probe_tools(
+        "git", "uv", timeout=tool_timeout
+    )
+
     # Git
-    git_path = shutil.which("git")
-    if git_path:
-        try:
-            result = subprocess.run(
-                ["git", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            git_version = result.stdout.strip()
-            print_success(f"{git_version}")
-        except Exception:
-            print_warning("git found but version check failed")
-    else:
+    if not git_found:
         print_warning("git not found (optional but recommended)")
+    elif git_error:
+        print_warning(f"git found but version check failed ({git_error})")
+    elif git_version is None:
+        print_success("git available")
+    else:
+        print_success(f"{git_version}")
 
     # uv (fast Python package manager)
-    uv_path = shutil.which("uv")
-    if uv_path:
-        try:
-            result = subprocess.run(
-                ["uv", "--version"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            uv_version = result.stdout.strip()
-            print_success(f"uv available ({uv_version})")
-        except Exception:
-            print_warning("uv found but version check failed")
-    else:
+    if not uv_found:
         print_info("uv not found (optional, for faster package installation)")
+    elif uv_error:
+        print_warning(f"uv found but version check failed ({uv_error})")
+    elif uv_version is None:
+        print_success("uv available")
+    else:
+        print_success(f"uv available ({uv_version})")
 
     return all_ok
 
@@ -369,12 +456,105 @@ def check_env_file(project_root: Path) -> bool:
         return False
 
 
+async def _run_check(buffer: io.StringIO, check, *args):
+    """Run a blocking check in a worker thread, capturing its output in buffer"""
+
+    def run():
+        _output.set(buffer)
+        return check(*args)
+
+    return await asyncio.to_thread(run)
+
+
+async def run_checks(
+    project_root: Path, verbose: bool = False, tool_timeout: float | None = None
+) -> list:
+    """
+    Run all independent checks concurrently.
+
+    Output is buffered per check and emitted in a fixed order once every check
+    has finished. A check that raises is returned as its exception instead of
+    aborting the others.
+    """
+    checks = [
+        (check_python_environment, ()),
+        (check_backend_packages, (verbose,)),
+        (check_frontend_packages, (project_root, verbose, tool_timeout)),
+        (check_system_tools, (tool_timeout,)),
+        (check_env_file, (project_root,)),
+    ]
+    buffers = [io.StringIO() for _ in checks]
+
+    results = await asyncio.gather(
+        *(_run_check(buffer, check, *args) for buffer, (check, args) in zip(buffers, checks)),
+        return_exceptions=True,
+    )
+
+    for buffer in buffers:
+        _emit(buffer.getvalue(), end="")
+
+    return results
+
+
+def _timeout_seconds(value: str) -> float:
+    """Parse --timeout, rejecting values too small for a tool to start"""
+    try:
+        seconds = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid timeout: {value!r}") from None
+    if not math.isfinite(seconds):
+        raise argparse.ArgumentTypeError(f"timeout must be a finite number, got {value}")
+    if seconds < 5:
+        raise argparse.ArgumentTypeError(f"timeout must be at least 5 seconds, got {value}")
+    return seconds
+
+
 def main():
     """Main function"""
-    print("\n" + "=" * 60)
-    print("🔍 DeepTutor Installation Checker")
-    print("=" * 60)
-    print("Checking all dependencies and configurations...")
+    parser = argparse.ArgumentParser(
+        description="Verify that DeepTutor dependencies are correctly installed"
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="Also report installed package versions (slower)",
+    )
+    parser.add_argument(
+        "--smoke-test",
+        action="store_true",
+        help="Run npm, node, git and uv to confirm they work, not only that they are on PATH",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=_timeout_seconds,
+        default=None,
+        help="Per-tool timeout in seconds for --smoke-test (minimum 5, default: 10)",
+    )
+    args = parser.parse_args()
+    if args.timeout is not None and not args.smoke_test:
+        parser.error("--timeout requires --smoke-test")
+
+    # Collect the whole report and write it with a single call at the end
+    report = io.StringIO()
+    token = _output.set(report)
+    try:
+        return run_report(
+            verbose=args.verbose,
+            tool_timeout=(args.timeout or 10.0) if args.smoke_test else None,
+        )
+    finally:
+        _output.reset(token)
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+
+
+def run_report(verbose: bool = False, tool_timeout: float | None = None) -> int:
+    """Run all checks and emit the report, returning the exit code"""
+    _emit("\n" + _RULE)
+    _emit("🔍 DeepTutor Installation Checker")
+    _emit(_RULE)
+    _emit("Checking all dependencies and configurations...")
 
     # Get project root
     script_dir = Path(__file__).parent
@@ -386,42 +566,64 @@ def main():
     all_checks_passed = True
     summary = []
 
+    python_result, backend_result, frontend_result, tools_result, env_result = asyncio.run(
+        run_checks(project_root, verbose, tool_timeout)
+    )
+
     # 1. Python environment
-    if check_python_environment():
+    if isinstance(python_result, BaseException):
+        summary.append(("Python Environment", f"❌ Check failed: {python_result}"))
+        all_checks_passed = False
+    elif python_result:
         summary.append(("Python Environment", "✅ OK"))
     else:
         summary.append(("Python Environment", "❌ Issues found"))
         all_checks_passed = False
 
     # 2. Backend packages
-    backend_ok, backend_installed, backend_missing = check_backend_packages()
-    if backend_ok:
-        summary.append(("Backend Dependencies", f"✅ OK ({backend_installed} packages)"))
-    else:
-        summary.append(
-            ("Backend Dependencies", f"❌ {backend_missing} missing, {backend_installed} installed")
-        )
+    if isinstance(backend_result, BaseException):
+        summary.append(("Backend Dependencies", f"❌ Check failed: {backend_result}"))
         all_checks_passed = False
+    else:
+        backend_ok, backend_installed, backend_missing = backend_result
+        if backend_ok:
+            summary.append(("Backend Dependencies", f"✅ OK ({backend_installed} packages)"))
+        else:
+            summary.append(
+                (
+                    "Backend Dependencies",
+                    f"❌ {backend_missing} missing, {backend_installed} installed",
+                )
+            )
+            all_checks_passed = False
 
     # 3. Frontend packages
-    frontend_ok, frontend_installed, frontend_missing = check_frontend_packages(project_root)
-    if frontend_ok:
-        summary.append(("Frontend Dependencies", f"✅ OK ({frontend_installed} packages)"))
+    if isinstance(frontend_result, BaseException):
+        summary.append(("Frontend Dependencies", f"❌ Check failed: {frontend_result}"))
+        all_checks_passed = False
     else:
-        summary.append(
-            (
-                "Frontend Dependencies",
-                f"❌ {frontend_missing} missing, {frontend_installed} installed",
+        frontend_ok, frontend_installed, frontend_missing = frontend_result
+        if frontend_ok:
+            summary.append(("Frontend Dependencies", f"✅ OK ({frontend_installed} packages)"))
+        else:
+            summary.append(
+                (
+                    "Frontend Dependencies",
+                    f"❌ {frontend_missing} missing, {frontend_installed} installed",
+                )
             )
-        )
-        all_checks_passed = False
+            all_checks_passed = False
 
     # 4. System tools
-    check_system_tools()
-    summary.append(("System Tools", "✅ Checked"))
+    if isinstance(tools_result, BaseException):
+        summary.append(("System Tools", f"⚠️ Check failed: {tools_result}"))
+    else:
+        summary.append(("System Tools", "✅ Checked"))
 
     # 5. Environment configuration
-    if check_env_file(project_root):
+    if isinstance(env_result, BaseException):
+        summary.append(("Environment Config", f"⚠️ Check failed: {env_result}"))
+    elif env_result:
         summary.append(("Environment Config", "✅ .env exists"))
     else:
         summary.append(("Environment Config", "⚠️ .env missing"))
@@ -430,9 +632,9 @@ def main():
     print_header("Summary")
 
     for item, status in summary:
-        print(f"  {item}: {status}")
+        _emit(f"  {item}: {status}")
 
-    print("")
+    _emit()
     if all_checks_passed:
         print_success("All required dependencies are installed!")
         print_info("You can start DeepTutor with: python scripts/start_web.py")
@@ -441,7 +643,7 @@ def main():
         print_info("Run: python scripts/install_all.py")
         print_info("Or manually install missing packages")
 
-    print("=" * 60 + "\n")
+    _emit(_RULE + "\n")
 
     return 0 if all_checks_passed else 1
 
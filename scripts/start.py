@@ -9,6 +9,7 @@ Provides a command-line interface for users to easily access:
 """
 
 import asyncio
+import os
 from pathlib import Path
 import sys
 
@@ -26,7 +27,8 @@ load_dotenv()
 
 # Add project root directory to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.agents.question import AgentCoordinator
 from src.agents.solve import MainSolver
@@ -85,10 +87,11 @@ class AITutorStarter:
                 return list(config.get("knowledge_bases", {}).keys())
 
         # Otherwise scan directory
-        kbs = []
-        for item in kb_base_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("."):
-                kbs.append(item.name)
+        # scandir reuses the directory listing's file type, avoiding a stat per entry
+        with os.scandir(kb_base_dir) as entries:
+            kbs = [
+                entry.name for entry in entries if entry.is_dir() and not entry.name.startswith(".")
+            ]
 
         return kbs if kbs else ["ai_textbook"]
 
@@ -311,19 +311,20 @@ def start_frontend():
 
     backend_port = get_backend_port(Path(project_root))
 
+    # Snapshot the environment once; it is read below and passed on to Next.js
+    env = os.environ.copy()
+    external_api_base = env.get("NEXT_PUBLIC_API_BASE_EXTERNAL")
+    custom_api_base = env.get("NEXT_PUBLIC_API_BASE")
+
     # Determine API base URL with priority:
     # 1. NEXT_PUBLIC_API_BASE_EXTERNAL (for cloud/remote deployment)
     # 2. NEXT_PUBLIC_API_BASE (custom API URL)
     # 3. Default: http://localhost:{backend_port}
-    api_base_url = (
-        os.environ.get("NEXT_PUBLIC_API_BASE_EXTERNAL")
-        or os.environ.get("NEXT_PUBLIC_API_BASE")
-        or f"http://localhost:{backend_port}"
-    )
+    api_base_url = external_api_base or custom_api_base or f"http://localhost:{backend_port}"
 
-    if os.environ.get("NEXT_PUBLIC_API_BASE_EXTERNAL"):
+    if external_api_base:
         print_flush(f"📌 Using external API URL from env: {api_base_url}")
-    elif os.environ.get("NEXT_PUBLIC_API_BASE"):
+    elif custom_api_base:
         print_flush(f"📌 Using custom API URL from env: {api_base_url}")
     else:
         print_flush(f"📌 Using default API URL: {api_base_url}")
@@ -352,7 +353,6 @@ def start_frontend():
         print_flush("   Continuing with environment variables only...")
 
     # Set environment variables for Next.js (as backup)
-    env = os.environ.copy()
     env["PORT"] = str(frontend_port)
     env["NEXT_PUBLIC_API_BASE"] = api_base_url
     # Set encoding environment variables for Windows
@@ -10,7 +10,8 @@ import sys
 from typing import Any
 
 project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.agents.base_agent import BaseAgent
 
@@ -43,7 +43,8 @@ def _get_project_root() -> Path:
 PROJECT_ROOT = _get_project_root()
 
 # Add project root to path for imports
-sys.path.insert(0, str(PROJECT_ROOT))
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.agents.research.agents import (
     DecomposeAgent,
@@ -12,7 +12,8 @@ import sys
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 
 _project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(_project_root))
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
 
 from src.agents.chat import ChatAgent, SessionManager
 from src.logging import get_logger
@@ -35,7 +35,8 @@ from src.utils.document_validator import DocumentValidator
 from src.utils.error_utils import format_exception_message
 
 _project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(_project_root))
+if str(_project_root) not in sys.path:
+    sys.path.insert(0, str(_project_root))
 from src.logging import get_logger
 from src.services.config import load_config_with_main
 from src.services.llm import get_llm_config
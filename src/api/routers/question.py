@@ -18,7 +18,8 @@ from src.utils.error_utils import format_exception_message
 
 # Add project root for imports
 project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.logging import get_logger
 from src.services.config import load_config_with_main
@@ -53,10 +53,12 @@ def load_dynamic_imports(project_root: Path):
     """Handle the path injections and dynamic imports safely."""
     global raganything_cls, RAGAnythingConfig
 
-    sys.path.insert(0, str(project_root))
-    raganything_path = project_root.parent / "raganything" / "RAG-Anything"
-    if raganything_path.exists():
-        sys.path.insert(0, str(raganything_path))
+    if str(project_root) not in sys.path:
+        sys.path.insert(0, str(project_root))
+    raganything_path = str(RAGANYTHING_PATH)
+    # Cheap membership test first; isdir is then a single stat
+    if raganything_path not in sys.path and os.path.isdir(raganything_path):
+        sys.path.insert(0, raganything_path)
 
     try:
         from raganything import RAGAnything as RA
@@ -68,6 +70,7 @@ def load_dynamic_imports(project_root: Path):
         pass
 
 
+from src.knowledge.config import RAGANYTHING_PATH
 from src.knowledge.extract_numbered_items import process_content_list
 from src.logging import LightRAGLogContext, get_logger
 from src.services.embedding import (
@@ -51,7 +51,7 @@ def setup_paths():
         sys.path.insert(0, str(PROJECT_ROOT))
 
     # Add raganything path (if exists)
-    if check_raganything() and str(RAGANYTHING_PATH) not in sys.path:
+    if str(RAGANYTHING_PATH) not in sys.path and check_raganything():
         sys.path.insert(0, str(RAGANYTHING_PATH))
 
 
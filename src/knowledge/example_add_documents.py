@@ -13,7 +13,8 @@ import sys
 
 # Add project root directory to path
 project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.knowledge.add_documents import DocumentAdder
 
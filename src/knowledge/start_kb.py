@@ -23,7 +23,9 @@ try:
 except ImportError:
     # If relative import fails, means this file is run directly
     # Add parent directory to path
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+    _project_root = str(Path(__file__).parent.parent.parent)
+    if _project_root not in sys.path:
+        sys.path.insert(0, _project_root)
     from src.knowledge.config import KNOWLEDGE_BASES_DIR, get_env_config, setup_paths
 
     setup_paths()
@@ -6,6 +6,7 @@ LightRAG Retriever
 Pure LightRAG retriever (text-only, no multimodal).
 """
 
+import os
 from pathlib import Path
 import sys
 from typing import Any, ClassVar, Dict, Optional
@@ -47,9 +48,10 @@ class LightRAGRetriever(BaseComponent):
 
         # Add LightRAG path
         project_root = Path(__file__).resolve().parent.parent.parent.parent.parent.parent
-        raganything_path = project_root.parent / "raganything" / "RAG-Anything"
-        if raganything_path.exists() and str(raganything_path) not in sys.path:
-            sys.path.insert(0, str(raganything_path))
+        raganything_path = str(project_root.parent / "raganything" / "RAG-Anything")
+        # Membership test first so repeated calls skip the stat
+        if raganything_path not in sys.path and os.path.isdir(raganything_path):
+            sys.path.insert(0, raganything_path)
 
         try:
             from lightrag import LightRAG
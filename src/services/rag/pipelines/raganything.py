@@ -6,6 +6,7 @@ RAGAnything Pipeline
 End-to-end pipeline wrapping RAG-Anything for academic document processing.
 """
 
+import os
 from pathlib import Path
 import sys
 from typing import Any, Dict, List, Optional
@@ -60,9 +61,10 @@ class RAGAnythingPipeline:
     def _setup_raganything_path(self):
         """Add RAG-Anything to sys.path if available."""
         project_root = Path(__file__).resolve().parent.parent.parent.parent.parent
-        raganything_path = project_root.parent / "raganything" / "RAG-Anything"
-        if raganything_path.exists() and str(raganything_path) not in sys.path:
-            sys.path.insert(0, str(raganything_path))
+        raganything_path = str(project_root.parent / "raganything" / "RAG-Anything")
+        # Membership test first so repeated calls skip the stat
+        if raganything_path not in sys.path and os.path.isdir(raganything_path):
+            sys.path.insert(0, raganything_path)
 
     def _get_rag_instance(self, kb_name: str):
         """Get or create RAGAnything instance."""
@@ -7,6 +7,7 @@ End-to-end pipeline wrapping RAG-Anything with Docling parser for document proce
 Uses Docling instead of MinerU for better Office document and HTML support.
 """
 
+import os
 from pathlib import Path
 import sys
 from typing import Any, Dict, List, Optional
@@ -67,9 +68,10 @@ class RAGAnythingDoclingPipeline:
     def _setup_raganything_path(self):
         """Add RAG-Anything to sys.path if available."""
         project_root = Path(__file__).resolve().parent.parent.parent.parent.parent
-        raganything_path = project_root.parent / "raganything" / "RAG-Anything"
-        if raganything_path.exists() and str(raganything_path) not in sys.path:
-            sys.path.insert(0, str(raganything_path))
+        raganything_path = str(project_root.parent / "raganything" / "RAG-Anything")
+        # Membership test first so repeated calls skip the stat
+        if raganything_path not in sys.path and os.path.isdir(raganything_path):
+            sys.path.insert(0, raganything_path)
 
     def _get_rag_instance(self, kb_name: str):
         """Get or create RAGAnything instance with Docling parser."""
@@ -24,7 +24,8 @@ if TYPE_CHECKING:
 
 # Project root is 3 levels up from src/tools/question/
 project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 # Note: AgentCoordinator is imported inside functions to avoid circular import
 from src.services.llm.config import get_llm_config
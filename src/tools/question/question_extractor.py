@@ -22,7 +22,8 @@ from typing import Any
 
 # Project root is 3 levels up from src/tools/question/
 project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.services.config import get_agent_params
 from src.services.llm import complete as llm_complete
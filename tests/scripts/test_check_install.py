@@ -0,0 +1,93 @@
+import argparse
+import asyncio
+from pathlib import Path
+import subprocess
+
+import pytest
+
+from scripts import check_install
+
+
+def test_run_checks_isolates_failing_check(monkeypatch, capsys):
+    def failing_check():
+        check_install.print_header("Python Environment")
+        raise RuntimeError("boom")
+
+    def passing_check(name, result):
+        def check(*args):
+            check_install.print_header(name)
+            return result
+
+        return check
+
+    monkeypatch.setattr(check_install, "check_python_environment", failing_check)
+    monkeypatch.setattr(
+        check_install, "check_backend_packages", passing_check("Backend", (True, 1, 0))
+    )
+    monkeypatch.setattr(
+        check_install, "check_frontend_packages", passing_check("Frontend", (True, 2, 0))
+    )
+    monkeypatch.setattr(check_install, "check_system_tools", passing_check("Tools", True))
+    monkeypatch.setattr(check_install, "check_env_file", passing_check("Env", False))
+
+    results = asyncio.run(check_install.run_checks(Path(".")))
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1:] == [(True, 1, 0), (True, 2, 0), True, False]
+
+    # The failing check's partial output is kept and sections stay in order
+    out = capsys.readouterr().out
+    headers = ["Python Environment", "Backend", "Frontend", "Tools", "Env"]
+    positions = [out.index(f"📋 {header}") for header in headers]
+    assert positions == sorted(positions)
+
+
+@pytest.mark.parametrize("value", ["4", "nan", "inf", "-inf", "abc"])
+def test_timeout_seconds_rejects_invalid_values(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        check_install._timeout_seconds(value)
+
+
+def test_timeout_seconds_accepts_valid_value():
+    assert check_install._timeout_seconds("10") == 10.0
+
+
+def test_timeout_requires_smoke_test(monkeypatch, capsys):
+    monkeypatch.setattr("sys.argv", ["check_install.py", "--timeout", "10"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        check_install.main()
+
+    assert exc_info.value.code == 2
+    assert "--timeout requires --smoke-test" in capsys.readouterr().err
+
+
+def test_probe_tool_reports_timeout(monkeypatch):
+    def slow_run(cmd, **kwargs):
+        raise subprocess.TimeoutExpired(cmd, kwargs["timeout"])
+
+    monkeypatch.setattr(check_install.shutil, "which", lambda command: f"/usr/bin/{command}")
+    monkeypatch.setattr(check_install.subprocess, "run", slow_run)
+
+    assert check_install.probe_tool("npm", timeout=5) == (True, None, "exceeded 5s, skipping")
+    # Without a timeout the tool is only located, never executed
+    assert check_install.probe_tool("npm") == (True, None, None)
+
+
+def test_is_installed_finds_packages_without_importing_them(monkeypatch, tmp_path):
+    regular = tmp_path / "ci_regular_pkg"
+    regular.mkdir()
+    (regular / "__init__.py").write_text("raise RuntimeError('package code was executed')\n")
+    (tmp_path / "ci_stray_dir").mkdir()
+    nested = tmp_path / "ci_namespace" / "core"
+    nested.mkdir(parents=True)
+    (nested / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    assert check_install.is_installed("ci_regular_pkg")
+    # Plain directories are picked up as namespace packages and must not count
+    assert not check_install.is_installed("ci_stray_dir")
+    assert not check_install.is_installed("ci_namespace")
+    assert check_install.is_installed("ci_namespace.core")
+    assert not check_install.is_installed("ci_missing_pkg")
+    assert not check_install.is_installed("ci_missing_pkg.core")